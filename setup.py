@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from setuptools import setup
+import os
 import sys
 
 module_name = "ufl"
@@ -16,6 +17,30 @@ tarball = None
 if 'dev' not in version:
     tarball = url + "downloads/fenics-{}-{}.tar.gz".format(module_name, version)
 
+# Optionally compile selected pure-Python modules with Cython. The .py
+# files remain the source of truth; set UFL_CYTHONIZE=1 to enable.
+CYTHON_MODULES = [
+    "ufl/core/ufl_type.py",
+    "ufl/core/multiindex.py",
+    "ufl/index_combination_utils.py",
+    "ufl/tensors.py",
+    "ufl/algorithms/compute_form_data.py",
+]
+
+ext_modules = []
+if os.environ.get("UFL_CYTHONIZE", "0") not in ("", "0"):
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        print("UFL_CYTHONIZE is set but Cython is not available, "
+              "installing pure Python modules only.")
+    else:
+        # The modules are untyped Python that relies on IndexError,
+        # so keep Cython's bounds checking and negative indexing
+        ext_modules = cythonize(
+            CYTHON_MODULES,
+            compiler_directives={"language_level": 3})
+
 CLASSIFIERS = """\
 Development Status :: 5 - Production/Stable
 Intended Audience :: Developers
@@ -52,4 +77,5 @@ setup(
         "ufl.formatting",
     ],
     package_dir={"ufl": "ufl"},
+    ext_modules=ext_modules,
     install_requires=["numpy"])
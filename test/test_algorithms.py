@@ -14,7 +14,8 @@ from ufl import (FiniteElement, TestFunction, TrialFunction, triangle,
                  FacetNormal, inner, dot, ds)
 from ufl.algorithms import (extract_arguments, expand_derivatives,
                             expand_indices, extract_elements,
-                            extract_unique_elements, extract_coefficients)
+                            extract_unique_elements, extract_coefficients,
+                            extract_sub_elements)
 from ufl.corealg.traversal import (pre_traversal, post_traversal,
                                    unique_pre_traversal, unique_post_traversal)
 
@@ -77,6 +78,28 @@ def test_extract_elements_and_extract_unique_elements(forms):
     assert extract_unique_elements(a) == (element1,)
 
 
+def test_extract_unique_sub_elements():
+    from ufl import VectorElement, MixedElement
+    from ufl.algorithms.analysis import (extract_unique_sub_elements,
+                                         unique_tuple)
+    P1 = FiniteElement("CG", triangle, 1)
+    P2 = VectorElement("CG", triangle, 2)
+    elements = (MixedElement(P2, P1), P1, P2, MixedElement(P2, P1))
+    unique = extract_unique_sub_elements(elements)
+    assert unique == unique_tuple(extract_sub_elements(elements))
+    assert unique == (MixedElement(P2, P1), P1, P2, P2.sub_elements()[0])
+
+
+def test_extract_typecode_mask(forms):
+    from ufl.classes import Argument, FacetNormal, Product
+    from ufl.algorithms.analysis import extract_typecode_mask
+    a, L, b = forms
+    mask = extract_typecode_mask(a)
+    assert mask == (1 << Argument._ufl_typecode_) | (1 << Product._ufl_typecode_)
+    assert not mask & (1 << FacetNormal._ufl_typecode_)
+    assert extract_typecode_mask(b) & (1 << FacetNormal._ufl_typecode_)
+
+
 def test_pre_and_post_traversal():
     element = FiniteElement("CG", "triangle", 1)
     v = TestFunction(element)
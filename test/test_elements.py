@@ -157,6 +157,20 @@ def test_quadrature_scheme():
             assert element == eval(repr(element))
 
 
+def test_finite_element_cache():
+    element = FiniteElement("CG", triangle, 2, variant="spectral")
+    assert FiniteElement("CG", "triangle", 2, variant="spectral") is element
+    assert FiniteElement("CG", triangle, 2) is not element
+    assert FiniteElement("CG", triangle, 2).variant() is None
+
+    # The cache does not keep otherwise unused elements alive
+    import gc
+    import weakref
+    ref = weakref.ref(FiniteElement("CG", triangle, 7, variant="unused"))
+    gc.collect()
+    assert ref() is None
+
+
 def test_missing_cell():
     # These special cases are here to allow missing
     # cell in PyDOLFIN Constant and Expression
@@ -221,3 +235,21 @@ def test_mse():
 
         element = FiniteElement('GLL-Edge L2', interval, degree - 1)
         assert element == eval(repr(element))
+
+
+def test_finite_element_subclass():
+    class DegreeShifted(FiniteElement):
+        __slots__ = ()
+
+        def __init__(self, family, cell, degree):
+            FiniteElement.__init__(self, family, cell, degree + 1)
+
+    class Fixed(FiniteElement):
+        __slots__ = ()
+
+        def __init__(self, tag):
+            FiniteElement.__init__(self, "CG", triangle, 1)
+
+    assert DegreeShifted("CG", triangle, 1).degree() == 2
+    assert Fixed(5).degree() == 1
+    assert FiniteElement("CG", triangle, 1).degree() == 1
@@ -86,6 +86,17 @@ def test_form_coefficients(element):
     assert (g * v * dx + f * v * dx(2)).coefficients() == (f, g)
 
 
+def test_form_constants(element):
+    domain = Mesh(VectorElement("Lagrange", triangle, 1))
+    v = TestFunction(element)
+    c = Constant(domain)
+    d = Constant(domain)
+
+    assert list((v * dx(domain)).constants()) == []
+    assert list((c * v * dx(domain)).constants()) == [c]
+    assert list((d * v * dx(domain) + c * v * ds(domain)).constants()) == [c, d]
+
+
 def test_form_domains():
     cell = triangle
     domain = Mesh(cell)
@@ -134,3 +145,22 @@ def test_form_call():
         a = u*v*dx
         M = eval("(a @ f) @ g")
         assert M == g*f*dx
+
+
+def test_form_data_reuses_element_mapping(load):
+    from ufl.algorithms import compute_form_data
+    fd1 = compute_form_data(load)
+    fd1.element_replace_map.clear()
+    fd2 = compute_form_data(load)
+    assert fd2.element_replace_map
+    assert fd2.element_replace_map is not fd1.element_replace_map
+    assert fd2.element_replace_map == compute_form_data(load).element_replace_map
+
+
+def test_form_data_max_subdomain_ids():
+    from ufl.algorithms import compute_form_data
+    f = Coefficient(FiniteElement("CG", triangle, 1))
+    fd = compute_form_data(f*dx(2) + f*dx(0) + f*ds(-1) + f*dS)
+    assert fd.max_subdomain_ids == {"cell": 3, "exterior_facet": 0,
+                                    "interior_facet": 0}
+    assert compute_form_data(f*dx(-1)).max_subdomain_ids == {"cell": 0}
@@ -86,3 +86,41 @@ def test_add_vectorexpr_b(vg, v, u, vf, b):
     tmp = vg + v + u + vf
     with pytest.raises(UFLException):
         tmp + b
+
+
+def test_facet_geometry_in_cell_integral():
+    n = FacetNormal(triangle)
+    f = Coefficient(selement())
+    compute_form_data(f*n[0]*ds)
+    with pytest.raises(UFLException):
+        compute_form_data(f*n[0]*dx)
+
+
+def test_later_facet_geometry_in_cell_integral():
+    import subprocess
+    import sys
+    # Register the new type in a separate process to keep it out of
+    # the global collection of UFL types in this one
+    code = """
+from ufl import *
+from ufl.algorithms import compute_form_data
+from ufl.classes import GeometricFacetQuantity
+from ufl.core.ufl_type import ufl_type
+
+@ufl_type()
+class LaterFacetQuantity(GeometricFacetQuantity):
+    __slots__ = ()
+    name = "later_facet_quantity"
+
+f = Coefficient(FiniteElement("Lagrange", triangle, 1))
+q = LaterFacetQuantity(f.ufl_domain())
+compute_form_data(f*q*ds)
+try:
+    compute_form_data(f*q*dx)
+except UFLException:
+    pass
+else:
+    raise RuntimeError("Facet quantity accepted in cell integral.")
+"""
+    subprocess.check_call([sys.executable, "-c", code],
+                          stdout=subprocess.DEVNULL)
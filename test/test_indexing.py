@@ -82,3 +82,16 @@ def test_componenttensor():
 
 def test_tensoralgebra():
     pass
+
+
+def test_too_many_fixed_indices(x1):
+    with pytest.raises(UFLException):
+        x1[0, 0]
+    with pytest.raises(UFLException):
+        x1[FixedIndex(0), FixedIndex(0)]
+
+
+def test_remove_missing_index():
+    from ufl.index_combination_utils import remove_indices
+    with pytest.raises(UFLException):
+        remove_indices((1, 2), (3, 3), (5,))
@@ -47,6 +47,17 @@ def test_tensor_indices(self):
         d = (u[i, i]+f[j, i])*dx
 
 
+def test_ellipsis_indices(self):
+    element = TensorElement("CG", "tetrahedron", 1, shape=(3, 3, 3))
+    f = Coefficient(element)
+    assert f[..., 0].ufl_shape == (3, 3)
+    assert f[0, ...].ufl_shape == (3, 3)
+    assert f[0, ..., 1].ufl_shape == (3,)
+    assert f[...] == f
+    with pytest.raises(UFLException):
+        f[..., 0, ...]
+
+
 def test_indexed_sum1(self):
     element = VectorElement("CG", "triangle", 1)
     u = Argument(element, 2)
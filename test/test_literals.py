@@ -159,3 +159,10 @@ def test_unit_dyads(self):
     self.assertEqual(as_matrix(((0, 1), (0, 0))), eij)
     self.assertEqual(as_matrix(((0, 0), (1, 0))), eji)
     self.assertEqual(as_matrix(((0, 0), (0, 1))), ejj)
+
+
+def test_numpy_arrays(self):
+    import numpy
+    self.assertEqual(as_vector(numpy.array([1.0, 2.0])), as_vector((1.0, 2.0)))
+    self.assertEqual(as_vector(numpy.arange(2)), as_vector((0, 1)))
+    self.assertEqual(as_matrix(numpy.identity(2)), as_matrix(((1.0, 0.0), (0.0, 1.0))))
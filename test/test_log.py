@@ -0,0 +1,28 @@
+#!/usr/bin/env py.test
+# -*- coding: utf-8 -*-
+
+from ufl.log import Logger, INFO, WARNING
+
+
+class CountingArg(object):
+    def __init__(self):
+        self.count = 0
+
+    def __str__(self):
+        self.count += 1
+        return "arg"
+
+
+def test_log_skips_formatting_below_level():
+    log = Logger("UFLTestLog")
+    # Keep the records away from handlers installed on the root logger
+    # by the test runner
+    log.get_logger().propagate = False
+    log.set_level(WARNING)
+    arg = CountingArg()
+    log.info("message %s", arg)
+    assert arg.count == 0
+
+    log.set_level(INFO)
+    log.info("message %s", arg)
+    assert arg.count == 1
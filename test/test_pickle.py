@@ -14,6 +14,7 @@ import pytest
 from ufl import *
 from ufl.algorithms import compute_form_data
 
+import os
 import pickle
 p = pickle.HIGHEST_PROTOCOL
 
@@ -551,3 +552,16 @@ def testFormData():
     form_data_restore = pickle.loads(form_data_pickle)
 
     assert(str(form_data) == str(form_data_restore))
+
+
+def testIndexHashAcrossProcesses():
+    import subprocess
+    import sys
+    code = ("import pickle, sys; from ufl.core.multiindex import Index; "
+            "i = Index(777); sys.stdout.buffer.write(pickle.dumps((i, {i})))")
+    for seed in ("1", "2"):
+        env = dict(os.environ, PYTHONHASHSEED=seed)
+        data = subprocess.check_output([sys.executable, "-c", code], env=env)
+        i, s = pickle.loads(data)
+        assert i in s
+        assert Index(777) in s
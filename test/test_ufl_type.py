@@ -0,0 +1,29 @@
+#!/usr/bin/env py.test
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from ufl.classes import Operator, Terminal, ListTensor, Coefficient
+from ufl.core.ufl_type import check_is_terminal_consistency
+
+
+def test_is_terminal_consistent():
+    check_is_terminal_consistency(ListTensor)
+    check_is_terminal_consistency(Coefficient)
+
+
+def test_is_terminal_conflict_raises():
+    # Checked directly on unregistered classes to avoid adding
+    # them to the global collection of UFL types
+    class TerminalOperator(Operator):
+        __slots__ = ()
+        _ufl_is_terminal_ = True
+
+    class OperatorTerminal(Terminal):
+        __slots__ = ()
+        _ufl_is_terminal_ = False
+
+    with pytest.raises(TypeError):
+        check_is_terminal_consistency(TerminalOperator)
+    with pytest.raises(TypeError):
+        check_is_terminal_consistency(OperatorTerminal)
@@ -51,17 +51,24 @@ def __unused__extract_classes(a):
                for o in unique_pre_traversal(e))
 
 
-def extract_type(a, ufl_type):
+def extract_type(a, ufl_type, visited=None):
     """Build a set of all objects of class ufl_type found in a.
-    The argument a can be a Form, Integral or Expr."""
+    The argument a can be a Form, Integral or Expr.
+
+    Subexpressions shared between integrands are only traversed
+    once. A visited set can be passed to share this between calls,
+    objects only found in previously visited subexpressions are then
+    left out of the result."""
+    if visited is None:
+        visited = set()
     if issubclass(ufl_type, Terminal):
         # Optimization
         return set(o for e in iter_expressions(a)
-                   for o in traverse_unique_terminals(e)
+                   for o in traverse_unique_terminals(e, visited)
                    if isinstance(o, ufl_type))
     else:
         return set(o for e in iter_expressions(a)
-                   for o in unique_pre_traversal(e)
+                   for o in unique_pre_traversal(e, visited)
                    if isinstance(o, ufl_type))
 
 
@@ -88,6 +95,18 @@ def has_exact_type(a, ufl_type):
     return any(o._ufl_typecode_ == tc for e in iter_expressions(a) for o in traversal(e))
 
 
+def extract_typecode_mask(a):
+    """Build an integer bitmask with bit number ``o._ufl_typecode_`` set
+    for each object o found in a.
+    The argument a can be a Form, Integral or Expr."""
+    mask = 0
+    visited = set()
+    for e in iter_expressions(a):
+        for o in unique_pre_traversal(e, visited):
+            mask |= 1 << o._ufl_typecode_
+    return mask
+
+
 def extract_arguments(a):
     """Build a sorted list of all arguments in a,
     which can be a Form, Integral or Expr."""
@@ -160,6 +179,24 @@ def extract_sub_elements(elements):
     return tuple(elements) + extract_sub_elements(sub_elements)
 
 
+def extract_unique_sub_elements(elements):
+    """Build tuple of all unique sub elements (including parent element).
+
+    Equivalent to unique_tuple(extract_sub_elements(elements)), but
+    sub elements of repeated elements are never expanded."""
+    unique_elements = []
+    handled = set()
+    while elements:
+        sub_elements = []
+        for e in elements:
+            if e not in handled:
+                handled.add(e)
+                unique_elements.append(e)
+                sub_elements.extend(e.sub_elements())
+        elements = sub_elements
+    return tuple(unique_elements)
+
+
 def sort_elements(elements):
     """
     Sort elements so that any sub elements appear before the
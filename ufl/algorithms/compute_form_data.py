@@ -10,16 +10,18 @@ raw input form given by a user."""
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 
 from itertools import chain
+import weakref
 
 from ufl.log import error, info
 from ufl.utils.sequences import max_degree
+from ufl.utils.sorting import sorted_by_count
 
-from ufl.classes import GeometricFacetQuantity, Coefficient, Form, FunctionSpace
-from ufl.corealg.traversal import traverse_unique_terminals
-from ufl.algorithms.analysis import extract_coefficients, extract_sub_elements, unique_tuple
+from ufl.classes import Expr, GeometricFacetQuantity, Coefficient, Form, FunctionSpace
+from ufl.algorithms.analysis import (extract_type, extract_sub_elements,
+                                     extract_unique_sub_elements, extract_typecode_mask,
+                                     unique_tuple)
 from ufl.algorithms.formdata import FormData
-from ufl.algorithms.formtransformations import compute_form_arities
-from ufl.algorithms.check_arities import check_form_arity
+from ufl.algorithms.check_arities import check_integrand_arity
 
 # These are the main symbolic processing steps:
 from ufl.algorithms.apply_function_pullbacks import apply_function_pullbacks
@@ -34,7 +36,6 @@ from ufl.algorithms.comparison_checker import do_comparison_check
 
 # See TODOs at the call sites of these below:
 from ufl.algorithms.domain_analysis import build_integral_data
-from ufl.algorithms.domain_analysis import reconstruct_form_from_integral_data
 from ufl.algorithms.domain_analysis import group_form_integrals
 
 
@@ -50,8 +51,25 @@ def _auto_select_degree(elements):
     return max_degree({e.degree() for e in elements} - {None} | {1})
 
 
+# Element mappings already computed for forms that are still alive.
+# Repeated preprocessing of the same form (e.g. when a form compiler
+# recomputes form data for its disk cache) reuses the mapping, and
+# entries are dropped together with their form.
+_element_mapping_cache = weakref.WeakKeyDictionary()
+
+
 def _compute_element_mapping(form):
     "Compute element mapping for element replacement"
+    element_mapping = _element_mapping_cache.get(form)
+    if element_mapping is None:
+        element_mapping = _build_element_mapping(form)
+        _element_mapping_cache[form] = element_mapping
+    # Hand out a copy so callers modifying their FormData do not
+    # affect later preprocessing of the same form
+    return dict(element_mapping)
+
+
+def _build_element_mapping(form):
     # The element mapping is a slightly messy concept with two use
     # cases:
     # - Expression with missing cell or element TODO: Implement proper
@@ -64,8 +82,9 @@ def _compute_element_mapping(form):
                                                    form.coefficients())]
     elements = extract_sub_elements(elements)
 
-    # Try to find a common degree for elements
-    common_degree = _auto_select_degree(elements)
+    # Common degree for elements with missing degree, only computed
+    # if such an element is found
+    common_degree = None
 
     # Compute element map
     element_mapping = {}
@@ -82,13 +101,16 @@ def _compute_element_mapping(form):
                        for d in domains):
                 error("Cannot replace unknown element cell without unique common cell in form.")
             cell = domains[0].ufl_cell()
-            info("Adjusting missing element cell to %s." % (cell,))
+            info("Adjusting missing element cell to %s.", cell)
             reconstruct = True
 
         # Set degree
         degree = element.degree()
         if degree is None:
-            info("Adjusting missing element degree to %d" % (common_degree,))
+            # Try to find a common degree for elements
+            if common_degree is None:
+                common_degree = _auto_select_degree(elements)
+            info("Adjusting missing element degree to %d", common_degree)
             degree = common_degree
             reconstruct = True
 
@@ -101,20 +123,6 @@ def _compute_element_mapping(form):
     return element_mapping
 
 
-def _compute_max_subdomain_ids(integral_data):
-    max_subdomain_ids = {}
-    for itg_data in integral_data:
-        it = itg_data.integral_type
-        si = itg_data.subdomain_id
-        if isinstance(si, int):
-            newmax = si + 1
-        else:
-            newmax = 0
-        prevmax = max_subdomain_ids.get(it, 0)
-        max_subdomain_ids[it] = max(prevmax, newmax)
-    return max_subdomain_ids
-
-
 def _compute_form_data_elements(self, arguments, coefficients, domains):
     self.argument_elements = tuple(f.ufl_element() for f in arguments)
     self.coefficient_elements = tuple(f.ufl_element() for f in coefficients)
@@ -130,43 +138,62 @@ def _compute_form_data_elements(self, arguments, coefficients, domains):
     #       elements here.
 
     all_elements = self.argument_elements + self.coefficient_elements + self.coordinate_elements
-    all_sub_elements = extract_sub_elements(all_elements)
 
     self.unique_elements = unique_tuple(all_elements)
-    self.unique_sub_elements = unique_tuple(all_sub_elements)
+    self.unique_sub_elements = extract_unique_sub_elements(self.unique_elements)
 
 
 def _check_elements(form_data):
-    for element in chain(form_data.unique_elements,
-                         form_data.unique_sub_elements):
+    # The unique sub elements include the unique elements themselves
+    for element in form_data.unique_sub_elements:
         if element.family() is None:
             error("Found element with undefined familty: %s" % repr(element))
         if element.cell() is None:
             error("Found element with undefined cell: %s" % repr(element))
 
 
+# Bitmask with the bits of all GeometricFacetQuantity typecodes set,
+# together with the number of registered classes it was computed from
+_facet_quantity_typecodes = (0, 0)
+
+
+def _facet_quantity_typecode_mask():
+    "Return the typecode bitmask of all GeometricFacetQuantity classes."
+    global _facet_quantity_typecodes
+    num_classes, mask = _facet_quantity_typecodes
+    # Recompute when types have been registered since the last call
+    if num_classes != len(Expr._ufl_all_classes_):
+        mask = sum(1 << cls._ufl_typecode_
+                   for cls in Expr._ufl_all_classes_
+                   if issubclass(cls, GeometricFacetQuantity))
+        _facet_quantity_typecodes = (len(Expr._ufl_all_classes_), mask)
+    return mask
+
+
 def _check_facet_geometry(integral_data):
     for itg_data in integral_data:
+        it = itg_data.integral_type
+        # Facet geometry is only valid in facet integrals.
+        # Allowing custom integrals to pass as well, although
+        # that's not really strict enough.
+        if "facet" in it or "custom" in it or "interface" in it:
+            continue
+        # Not a facet integral
         for itg in itg_data.integrals:
-            it = itg_data.integral_type
-            # Facet geometry is only valid in facet integrals.
-            # Allowing custom integrals to pass as well, although
-            # that's not really strict enough.
-            if not ("facet" in it or "custom" in it or "interface" in it):
-                # Not a facet integral
-                for expr in traverse_unique_terminals(itg.integrand()):
-                    cls = expr._ufl_class_
-                    if issubclass(cls, GeometricFacetQuantity):
-                        error("Integral of type %s cannot contain a %s." % (it, cls.__name__))
-
-
-def _check_form_arity(preprocessed_form):
+            mask = extract_typecode_mask(itg) & _facet_quantity_typecode_mask()
+            if mask:
+                # Report the facet quantity with the lowest typecode
+                cls = Expr._ufl_all_classes_[(mask & -mask).bit_length() - 1]
+                error("Integral of type %s cannot contain a %s." % (it, cls.__name__))
+
+
+def _check_form_arity(integral_data, arguments, complex_mode):
     # Check that we don't have a mixed linear/bilinear form or
-    # anything like that
-    # FIXME: This is slooow and should be moved to form compiler
-    # and/or replaced with something faster
-    if 1 != len(compute_form_arities(preprocessed_form)):
-        error("All terms in form must have same rank.")
+    # anything like that, directly on the integrands instead of
+    # reconstructing a Form from the integral data first
+    for itg_data in integral_data:
+        for itg in itg_data.integrals:
+            check_integrand_arity(itg.integrand(), arguments, complex_mode)
 
 
 def _build_coefficient_replace_map(coefficients, element_mapping=None):
@@ -290,8 +317,14 @@ def compute_form_data(form,
     if do_apply_integral_scaling:
         form = apply_integral_scaling(form)
 
+    # Restrictions only apply to interior facet integrals, skip
+    # rebuilding the form for them if there are none
+    has_interior_facet_integrals = any(
+        itg.integral_type().startswith("interior_facet")
+        for itg in form.integrals())
+
     # Apply default restriction to fully continuous terminals
-    if do_apply_default_restrictions:
+    if do_apply_default_restrictions and has_interior_facet_integrals:
         form = apply_default_restrictions(form)
 
     # Lower abstractions for geometric quantities into a smaller set
@@ -317,7 +350,7 @@ def compute_form_data(form,
     form = apply_coordinate_derivatives(form)
 
     # Propagate restrictions to terminals
-    if do_apply_restrictions:
+    if do_apply_restrictions and has_interior_facet_integrals:
         form = apply_restrictions(form)
 
     # If in real mode, remove any complex nodes introduced during form processing.
@@ -330,32 +363,47 @@ def compute_form_data(form,
 
     # --- Create replacements for arguments and coefficients
 
-    # Figure out which form coefficients each integral should enable
+    # Figure out which form coefficients each integral should enable,
+    # and at the same time which coefficients from the original form
+    # are actually used in any integral (Differentiation may reduce
+    # the set of coefficients w.r.t. the original form).
+    # Also store number of domains for integral types.
+    # TODO: Group this by domain first. For now keep a backwards
+    # compatible data structure.
+    max_subdomain_ids = {}
     for itg_data in self.integral_data:
         itg_coeffs = set()
-        # Get all coefficients in integrand
+        # Get all coefficients in integrands, traversing subexpressions
+        # shared between the integrals only once
+        visited = set()
         for itg in itg_data.integrals:
-            itg_coeffs.update(extract_coefficients(itg.integrand()))
+            itg_coeffs.update(extract_type(itg, Coefficient, visited))
         # Store with IntegralData object
         itg_data.integral_coefficients = itg_coeffs
 
-    # Figure out which coefficients from the original form are
-    # actually used in any integral (Differentiation may reduce the
-    # set of coefficients w.r.t. the original form)
-    reduced_coefficients_set = set()
-    for itg_data in self.integral_data:
-        reduced_coefficients_set.update(itg_data.integral_coefficients)
-    self.reduced_coefficients = sorted(reduced_coefficients_set,
-                                       key=lambda c: c.count())
+        # Only integer subdomain ids raise the maximum, the "otherwise"
+        # subdomain just makes sure the integral type is present
+        it = itg_data.integral_type
+        si = itg_data.subdomain_id
+        prevmax = max_subdomain_ids.setdefault(it, 0)
+        if isinstance(si, int) and si + 1 > prevmax:
+            max_subdomain_ids[it] = si + 1
+    self.max_subdomain_ids = max_subdomain_ids
+    reduced_coefficients_set = set().union(*[itg_data.integral_coefficients
+                                             for itg_data in self.integral_data])
+    self.reduced_coefficients = sorted_by_count(reduced_coefficients_set)
     self.num_coefficients = len(self.reduced_coefficients)
     self.original_coefficient_positions = [i for i, c in enumerate(self.original_form.coefficients())
-                                           if c in self.reduced_coefficients]
+                                           if c in reduced_coefficients_set]
 
     # Store back into integral data which form coefficients are used
     # by each integral
+    reduced_coefficient_numbering = dict((c, i) for i, c in enumerate(self.reduced_coefficients))
     for itg_data in self.integral_data:
-        itg_data.enabled_coefficients = [bool(coeff in itg_data.integral_coefficients)
-                                         for coeff in self.reduced_coefficients]
+        enabled_coefficients = [False] * self.num_coefficients
+        for coeff in itg_data.integral_coefficients:
+            enabled_coefficients[reduced_coefficient_numbering[coeff]] = True
+        itg_data.enabled_coefficients = enabled_coefficients
 
     # --- Collect some trivial data
 
@@ -391,23 +439,12 @@ def compute_form_data(form,
                                 renumbered_coefficients,
                                 self.original_form.ufl_domains())
 
-    # --- Store number of domains for integral types
-    # TODO: Group this by domain first. For now keep a backwards
-    # compatible data structure.
-    self.max_subdomain_ids = _compute_max_subdomain_ids(self.integral_data)
-
     # --- Checks
     _check_elements(self)
     _check_facet_geometry(self.integral_data)
+    _check_form_arity(self.integral_data, self.original_form.arguments(), complex_mode)
 
-    # TODO: This is a very expensive check... Replace with something
-    # faster!
-    preprocessed_form = reconstruct_form_from_integral_data(self.integral_data)
-
-    check_form_arity(preprocessed_form, self.original_form.arguments(), complex_mode)  # Currently testing how fast this is
-
-    # TODO: This member is used by unit tests, change the tests to
-    # remove this!
-    self.preprocessed_form = preprocessed_form
+    # Note: self.preprocessed_form is reconstructed from the integral
+    # data on first access, see FormData
 
     return self
@@ -20,6 +20,20 @@ class FormData(object):
 
     def __init__(self):
         "Create empty form data for given form."
+        self._preprocessed_form = None
+
+    @property
+    def preprocessed_form(self):
+        """The preprocessed form, reconstructed from the integral data on
+        first access.
+
+        TODO: This member is used by unit tests, change the tests to
+        remove this!
+        """
+        if self._preprocessed_form is None:
+            from ufl.algorithms.domain_analysis import reconstruct_form_from_integral_data
+            self._preprocessed_form = reconstruct_form_from_integral_data(self.integral_data)
+        return self._preprocessed_form
 
     def __str__(self):
         "Return formatted summary of form data"
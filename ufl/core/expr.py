@@ -19,6 +19,8 @@ This is to avoid circular dependencies between ``Expr`` and its subclasses.
 # Modified by Anders Logg, 2008
 # Modified by Massimiliano Leoni, 2016
 
+from array import array
+
 from ufl.log import error
 
 
@@ -247,11 +249,11 @@ class Expr(object):
 
     # A global array of the number of initialized objects for each
     # typecode
-    _ufl_obj_init_counts_ = [0]
+    _ufl_obj_init_counts_ = array("q", [0])
 
     # A global array of the number of deleted objects for each
     # typecode
-    _ufl_obj_del_counts_ = [0]
+    _ufl_obj_del_counts_ = array("q", [0])
 
     # Backup of default init and del
     _ufl_regular__init__ = __init__
@@ -279,7 +281,7 @@ class Expr(object):
         "Turn off the object counting mechanism. Return object init and del counts."
         Expr.__init__ = Expr._ufl_regular__init__
         delattr(Expr, "__del__")
-        return (Expr._ufl_obj_init_counts_, Expr._ufl_obj_del_counts_)
+        return (Expr._ufl_obj_init_counts_.tolist(), Expr._ufl_obj_del_counts_.tolist())
 
     # === Abstract functions that must be implemented by subclasses ===
 
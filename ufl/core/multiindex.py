@@ -75,19 +75,22 @@ class Index(IndexBase):
     """UFL value: An index with no value assigned.
 
     Used to represent free indices in Einstein indexing notation."""
-    __slots__ = ("_count",)
+    __slots__ = ("_count", "_hash")
 
     _globalcount = 0
 
     def __init__(self, count=None):
         IndexBase.__init__(self)
         counted_init(self, count, Index)
+        # Only hash the integer count, hashes of strings differ between
+        # processes and this value is carried along when pickling
+        self._hash = hash(self._count)
 
     def count(self):
         return self._count
 
     def __hash__(self):
-        return hash(("Index", self._count))
+        return self._hash
 
     def __eq__(self, other):
         return isinstance(other, Index) and (self._count == other._count)
@@ -117,10 +120,22 @@ class MultiIndex(Terminal):
         if not isinstance(indices, tuple):
             error("Expecting a tuple of indices.")
 
-        if all(isinstance(ind, FixedIndex) for ind in indices):
+        # Validate the indices and collect the values of a purely
+        # fixed multiindex in a single pass
+        key = []
+        for ind in indices:
+            if isinstance(ind, FixedIndex):
+                if key is not None:
+                    key.append(ind._value)
+            elif isinstance(ind, IndexBase):
+                key = None
+            else:
+                error("Expecting only Index and FixedIndex objects.")
+
+        if key is not None:
             # Cache multiindices consisting of purely fixed indices
             # (aka flyweight pattern)
-            key = tuple(ind._value for ind in indices)
+            key = tuple(key)
             self = MultiIndex._cache.get(key)
             if self is not None:
                 return self
@@ -129,8 +144,6 @@ class MultiIndex(Terminal):
         else:
             # Create a new object if we have any free indices (too
             # many combinations to cache)
-            if not all(isinstance(ind, IndexBase) for ind in indices):
-                error("Expecting only Index and FixedIndex objects.")
             self = Terminal.__new__(cls)
 
         # Initialize here instead of in __init__ to avoid overwriting
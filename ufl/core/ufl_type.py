@@ -44,11 +44,10 @@ def attach_operators_from_hash_data(cls):
 
 def get_base_attr(cls, name):
     "Return first non-``None`` attribute of given name among base classes."
-    for base in cls.mro():
-        if hasattr(base, name):
-            attr = getattr(base, name)
-            if attr is not None:
-                return attr
+    for base in cls.__mro__:
+        attr = getattr(base, name, None)
+        if attr is not None:
+            return attr
     return None
 
 
@@ -88,7 +87,13 @@ def check_is_terminal_consistency(cls):
                " Did you forget to inherit from Terminal or Operator?")
         raise TypeError(msg.format(cls))
 
-    base_is_terminal = get_base_attr(cls, "_ufl_is_terminal_")
+    # Compare with the trait inherited from the base classes, not
+    # including cls itself which already has the trait set
+    base_is_terminal = None
+    for base in cls.__mro__[1:]:
+        base_is_terminal = getattr(base, "_ufl_is_terminal_", None)
+        if base_is_terminal is not None:
+            break
     if base_is_terminal is not None and cls._ufl_is_terminal_ != base_is_terminal:
         msg = ("Conflicting given and automatic 'is_terminal' trait for class {0.__name__}." +
                " Check if you meant to inherit from Terminal or Operator.")
@@ -97,7 +102,7 @@ def check_is_terminal_consistency(cls):
 
 def check_abstract_trait_consistency(cls):
     "Check that the first base classes up to ``Expr`` are other UFL types."
-    for base in cls.mro():
+    for base in cls.__mro__:
         if base is Expr:
             break
         if not issubclass(base, Expr) and base._ufl_is_abstract_:
@@ -118,7 +123,7 @@ def check_has_slots(cls):
         raise TypeError(msg.format(cls))
 
     # Check base classes for __slots__ as well, skipping object which is the last one
-    for base in cls.mro()[1:-1]:
+    for base in cls.__mro__[1:-1]:
         if "__slots__" not in base.__dict__:
             msg = ("Class {0.__name__} is has a base class "
                    "{1.__name__} with __slots__ missing.")
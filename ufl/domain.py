@@ -94,6 +94,9 @@ class Mesh(AbstractDomain):
         tdim = coordinate_element.cell().topological_dimension()
         AbstractDomain.__init__(self, tdim, gdim)
 
+        # Cache repr string, used by repr of all geometric quantities
+        self._repr = "Mesh(%s, %s)" % (repr(self._ufl_coordinate_element), repr(self._ufl_id))
+
     def ufl_cargo(self):
         "Return carried object that will not be used by UFL."
         return self._ufl_cargo
@@ -108,8 +111,7 @@ class Mesh(AbstractDomain):
         return (self._ufl_coordinate_element.degree() == 1) and self.ufl_cell().is_simplex()
 
     def __repr__(self):
-        r = "Mesh(%s, %s)" % (repr(self._ufl_coordinate_element), repr(self._ufl_id))
-        return r
+        return self._repr
 
     def __str__(self):
         return "<Mesh #%s>" % (self._ufl_id,)
@@ -145,6 +147,9 @@ class MeshView(AbstractDomain):
         tdim = coordinate_element.cell().topological_dimension()
         AbstractDomain.__init__(self, tdim, gdim)
 
+        # Cache repr string
+        self._repr = "MeshView(%s, %s, %s)" % (repr(self._ufl_mesh), repr(tdim), repr(self._ufl_id))
+
     def ufl_mesh(self):
         return self._ufl_mesh
 
@@ -155,9 +160,7 @@ class MeshView(AbstractDomain):
         return self._ufl_mesh.is_piecewise_linear_simplex_domain()
 
     def __repr__(self):
-        tdim = self.topological_dimension()
-        r = "MeshView(%s, %s, %s)" % (repr(self._ufl_mesh), repr(tdim), repr(self._ufl_id))
-        return r
+        return self._repr
 
     def __str__(self):
         return "<MeshView #%s of dimension %d over mesh %s>" % (
@@ -203,6 +206,9 @@ class TensorProductMesh(AbstractDomain):
 
         AbstractDomain.__init__(self, tdim, gdim)
 
+        # Cache repr string
+        self._repr = "TensorProductMesh(%s, %s)" % (repr(self._ufl_meshes), repr(self._ufl_id))
+
     def ufl_coordinate_element(self):
         return self._ufl_coordinate_element
 
@@ -213,8 +219,7 @@ class TensorProductMesh(AbstractDomain):
         return False  # TODO: Any cases this is True
 
     def __repr__(self):
-        r = "TensorProductMesh(%s, %s)" % (repr(self._ufl_meshes), repr(self._ufl_id))
-        return r
+        return self._repr
 
     def __str__(self):
         return "<TensorProductMesh #%s with meshes %s>" % (
@@ -12,6 +12,8 @@ from ufl.finiteelement.finiteelementbase import FiniteElementBase
 
 class BrokenElement(FiniteElementBase):
     """The discontinuous version of an existing Finite Element space."""
+    __slots__ = ("_element",)
+
     def __init__(self, element):
         self._element = element
         self._repr = "BrokenElement(%s)" % repr(element)
@@ -20,6 +20,8 @@ class EnrichedElementBase(FiniteElementBase):
 
         .. math:: \\textrm{EnrichedElement}(V, Q) = \\{v + q | v \\in V, q \\in Q\\}.
     """
+    __slots__ = ("_elements",)
+
     def __init__(self, *elements):
         self._elements = elements
 
@@ -99,6 +101,8 @@ class EnrichedElement(EnrichedElementBase):
         resulting element is not nodal even when subelements are.
         Structured basis may be exploited in form compilers.
     """
+    __slots__ = ()
+
     def is_cellwise_constant(self):
         """Return whether the basis functions of this
         element is spatially constant over each cell."""
@@ -122,6 +126,8 @@ class NodalEnrichedElement(EnrichedElementBase):
         a concatenation of subelements dual bases; resulting
         element is nodal.
     """
+    __slots__ = ()
+
     def is_cellwise_constant(self):
         """Return whether the basis functions of this
         element is spatially constant over each cell."""
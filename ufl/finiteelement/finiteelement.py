@@ -12,6 +12,8 @@
 # Modified by Anders Logg 2014
 # Modified by Massimiliano Leoni, 2016
 
+import weakref
+
 from ufl.log import error
 from ufl.utils.formatting import istr
 from ufl.cell import as_cell
@@ -21,6 +23,94 @@ from ufl.finiteelement.elementlist import canonical_element_description, simplic
 from ufl.finiteelement.finiteelementbase import FiniteElementBase
 
 
+def _interval_cg_dg(degree, variant):
+    """Return the continuous and discontinuous interval elements that
+    tensor product H(div) and H(curl) elements are built from."""
+    return (FiniteElement("CG", "interval", degree, variant=variant),
+            FiniteElement("DG", "interval", degree - 1, variant=variant))
+
+
+def _check_sub_cells(family, cell, cellname_h, cellname_v):
+    "Check the cellnames of the two factors of a TensorProductCell."
+    cell_h, cell_v = cell.sub_cells()
+    if cell_h.cellname() != cellname_h or cell_v.cellname() != cellname_v:
+        error("%s is available on TensorProductCell(%s, %s) only." % (family, cellname_h, cellname_v))
+
+
+# Delay imports in the builders below to avoid circular dependency at
+# module load time
+
+def _build_rtc(family, cell, degree, variant):
+    "Build RTCF or RTCE on TensorProductCell(interval, interval)."
+    from ufl.finiteelement.tensorproductelement import TensorProductElement
+    from ufl.finiteelement.enrichedelement import EnrichedElement
+    from ufl.finiteelement.hdivcurl import HDivElement, HCurlElement
+
+    _check_sub_cells(family, cell, "interval", "interval")
+    C_elt, D_elt = _interval_cg_dg(degree, variant)
+
+    CxD_elt = TensorProductElement(C_elt, D_elt, cell=cell)
+    DxC_elt = TensorProductElement(D_elt, C_elt, cell=cell)
+
+    wrap = HDivElement if family == "RTCF" else HCurlElement
+    return EnrichedElement(wrap(CxD_elt), wrap(DxC_elt))
+
+
+def _build_nc(family, cell, degree, variant):
+    "Build NCF or NCE on TensorProductCell(quadrilateral, interval)."
+    from ufl.finiteelement.tensorproductelement import TensorProductElement
+    from ufl.finiteelement.enrichedelement import EnrichedElement
+    from ufl.finiteelement.hdivcurl import HDivElement, HCurlElement
+
+    _check_sub_cells(family, cell, "quadrilateral", "interval")
+    if family == "NCF":
+        wrap = HDivElement
+        Qc_elt = FiniteElement("RTCF", "quadrilateral", degree, variant=variant)
+        Qd_elt = FiniteElement("DQ", "quadrilateral", degree - 1, variant=variant)
+    else:
+        wrap = HCurlElement
+        Qc_elt = FiniteElement("Q", "quadrilateral", degree, variant=variant)
+        Qd_elt = FiniteElement("RTCE", "quadrilateral", degree, variant=variant)
+
+    Ic_elt, Id_elt = _interval_cg_dg(degree, variant)
+
+    return EnrichedElement(wrap(TensorProductElement(Qc_elt, Id_elt, cell=cell)),
+                           wrap(TensorProductElement(Qd_elt, Ic_elt, cell=cell)))
+
+
+# Families of the factors of Q, DQ and DQ L2 elements, for simplex and
+# non-simplex sub cells respectively
+_tensor_product_sub_families = {
+    "Q": ("CG", "CG"),
+    "DQ": ("DG", "DQ"),
+    "DQ L2": ("DG L2", "DQ L2"),
+}
+
+
+def _build_q(family, cell, degree, variant):
+    "Build Q, DQ or DQ L2 as a tensor product of elements on the sub cells."
+    from ufl.finiteelement.tensorproductelement import TensorProductElement
+
+    simplex_family, other_family = _tensor_product_sub_families[family]
+    return TensorProductElement(*[FiniteElement(simplex_family if c.cellname() in simplices else other_family,
+                                                c, degree, variant=variant)
+                                  for c in cell.sub_cells()],
+                                cell=cell)
+
+
+# Builders for families that expand into other element types on
+# TensorProductCells
+_tensor_product_builders = {
+    "RTCF": _build_rtc,
+    "RTCE": _build_rtc,
+    "NCF": _build_nc,
+    "NCE": _build_nc,
+    "Q": _build_q,
+    "DQ": _build_q,
+    "DQ L2": _build_q,
+}
+
+
 class FiniteElement(FiniteElementBase):
     "The basic finite element class for all simple finite elements."
     # TODO: Move these to base?
@@ -29,6 +119,10 @@ class FiniteElement(FiniteElementBase):
                  "_mapping",
                  "_variant")
 
+    # Weak so that elements no longer referenced anywhere else can be
+    # collected
+    _cache = weakref.WeakValueDictionary()
+
     def __new__(cls,
                 family,
                 cell=None,
@@ -41,85 +135,37 @@ class FiniteElement(FiniteElementBase):
         if cell is not None:
             cell = as_cell(cell)
 
+        description = None
         if isinstance(cell, TensorProductCell):
-            # Delay import to avoid circular dependency at module load time
-            from ufl.finiteelement.tensorproductelement import TensorProductElement
-            from ufl.finiteelement.enrichedelement import EnrichedElement
-            from ufl.finiteelement.hdivcurl import HDivElement as HDiv, HCurlElement as HCurl
-
-            family, short_name, degree, value_shape, reference_value_shape, sobolev_space, mapping = \
-                canonical_element_description(family, cell, degree, form_degree)
-
-            if family in ["RTCF", "RTCE"]:
-                cell_h, cell_v = cell.sub_cells()
-                if cell_h.cellname() != "interval":
-                    error("%s is available on TensorProductCell(interval, interval) only." % family)
-                if cell_v.cellname() != "interval":
-                    error("%s is available on TensorProductCell(interval, interval) only." % family)
-
-                C_elt = FiniteElement("CG", "interval", degree, variant=variant)
-                D_elt = FiniteElement("DG", "interval", degree - 1, variant=variant)
-
-                CxD_elt = TensorProductElement(C_elt, D_elt, cell=cell)
-                DxC_elt = TensorProductElement(D_elt, C_elt, cell=cell)
-
-                if family == "RTCF":
-                    return EnrichedElement(HDiv(CxD_elt), HDiv(DxC_elt))
-                if family == "RTCE":
-                    return EnrichedElement(HCurl(CxD_elt), HCurl(DxC_elt))
-
-            elif family == "NCF":
-                cell_h, cell_v = cell.sub_cells()
-                if cell_h.cellname() != "quadrilateral":
-                    error("%s is available on TensorProductCell(quadrilateral, interval) only." % family)
-                if cell_v.cellname() != "interval":
-                    error("%s is available on TensorProductCell(quadrilateral, interval) only." % family)
-
-                Qc_elt = FiniteElement("RTCF", "quadrilateral", degree, variant=variant)
-                Qd_elt = FiniteElement("DQ", "quadrilateral", degree - 1, variant=variant)
-
-                Id_elt = FiniteElement("DG", "interval", degree - 1, variant=variant)
-                Ic_elt = FiniteElement("CG", "interval", degree, variant=variant)
-
-                return EnrichedElement(HDiv(TensorProductElement(Qc_elt, Id_elt, cell=cell)),
-                                       HDiv(TensorProductElement(Qd_elt, Ic_elt, cell=cell)))
-
-            elif family == "NCE":
-                cell_h, cell_v = cell.sub_cells()
-                if cell_h.cellname() != "quadrilateral":
-                    error("%s is available on TensorProductCell(quadrilateral, interval) only." % family)
-                if cell_v.cellname() != "interval":
-                    error("%s is available on TensorProductCell(quadrilateral, interval) only." % family)
-
-                Qc_elt = FiniteElement("Q", "quadrilateral", degree, variant=variant)
-                Qd_elt = FiniteElement("RTCE", "quadrilateral", degree, variant=variant)
-
-                Id_elt = FiniteElement("DG", "interval", degree - 1, variant=variant)
-                Ic_elt = FiniteElement("CG", "interval", degree, variant=variant)
-
-                return EnrichedElement(HCurl(TensorProductElement(Qc_elt, Id_elt, cell=cell)),
-                                       HCurl(TensorProductElement(Qd_elt, Ic_elt, cell=cell)))
-
-            elif family == "Q":
-                return TensorProductElement(*[FiniteElement("CG", c, degree, variant=variant)
-                                              for c in cell.sub_cells()],
-                                            cell=cell)
-
-            elif family == "DQ":
-                def dq_family(cell):
-                    return "DG" if cell.cellname() in simplices else "DQ"
-                return TensorProductElement(*[FiniteElement(dq_family(c), c, degree, variant=variant)
-                                              for c in cell.sub_cells()],
-                                            cell=cell)
-
-            elif family == "DQ L2":
-                def dq_family_l2(cell):
-                    return "DG L2" if cell.cellname() in simplices else "DQ L2"
-                return TensorProductElement(*[FiniteElement(dq_family_l2(c), c, degree, variant=variant)
-                                              for c in cell.sub_cells()],
-                                            cell=cell)
-
-        return super(FiniteElement, cls).__new__(cls)
+            description = canonical_element_description(family, cell, degree, form_degree)
+            family, short_name, degree, value_shape, reference_value_shape, sobolev_space, mapping = description
+
+            builder = _tensor_product_builders.get(family)
+            if builder is not None:
+                return builder(family, cell, degree, variant)
+
+        # Subclasses are initialized in __init__ as usual, their
+        # constructor arguments need not match those of FiniteElement
+        if cls is not FiniteElement:
+            return super(FiniteElement, cls).__new__(cls)
+
+        # Reuse identical plain finite elements, unhashable arguments
+        # are constructed without caching
+        key = (family, cell, degree, form_degree, quad_scheme, variant)
+        try:
+            self = FiniteElement._cache.get(key)
+        except TypeError:
+            key = None
+        else:
+            if self is not None:
+                return self
+
+        self = super(FiniteElement, cls).__new__(cls)
+        self._init(family, cell, degree, form_degree, quad_scheme, variant,
+                   description)
+        if key is not None:
+            FiniteElement._cache[key] = self
+        return self
 
     def __init__(self,
                  family,
@@ -145,12 +191,21 @@ class FiniteElement(FiniteElementBase):
             variant
                Hint for the local basis function variant (optional)
         """
+        # Plain FiniteElements are initialized in __new__, which may
+        # return a cached instance
+        if type(self) is not FiniteElement:
+            if cell is not None:
+                cell = as_cell(cell)
+            self._init(family, cell, degree, form_degree, quad_scheme, variant)
+
+    def _init(self, family, cell, degree, form_degree, quad_scheme, variant,
+              description=None):
         # Note: Unfortunately, dolfin sometimes passes None for
-        # cell. Until this is fixed, allow it:
-        if cell is not None:
-            cell = as_cell(cell)
-
-        family, short_name, degree, value_shape, reference_value_shape, sobolev_space, mapping = canonical_element_description(family, cell, degree, form_degree)
+        # cell. Until this is fixed, allow it (cell is converted with
+        # as_cell before calling this)
+        if description is None:
+            description = canonical_element_description(family, cell, degree, form_degree)
+        family, short_name, degree, value_shape, reference_value_shape, sobolev_space, mapping = description
 
         # TODO: Move these to base? Might be better to instead
         # simplify base though.
@@ -160,9 +215,10 @@ class FiniteElement(FiniteElementBase):
         self._variant = variant
 
         # Finite elements on quadrilaterals and hexahedrons have an IrreducibleInt as degree
-        if cell is not None:
-            if cell.cellname() in ["quadrilateral", "hexahedron"]:
-                from ufl.algorithms.estimate_degrees import IrreducibleInt
+        # (degrees of reconstructed elements are already wrapped)
+        if cell is not None and cell.cellname() in ("quadrilateral", "hexahedron"):
+            from ufl.algorithms.estimate_degrees import IrreducibleInt
+            if not isinstance(degree, IrreducibleInt):
                 degree = IrreducibleInt(degree)
 
         # Type check variant
@@ -246,6 +246,7 @@ class MixedElement(FiniteElementBase):
 
 class VectorElement(MixedElement):
     "A special case of a mixed finite element where all elements are equal."
+    __slots__ = ("_sub_element",)
 
     def __init__(self, family, cell=None, degree=None, dim=None,
                  form_degree=None, quad_scheme=None):
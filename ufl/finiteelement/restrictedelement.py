@@ -19,6 +19,8 @@ valid_restriction_domains = ("interior", "facet", "face", "edge", "vertex")
 
 class RestrictedElement(FiniteElementBase):
     "Represents the restriction of a finite element to a type of cell entity."
+    __slots__ = ("_element", "_restriction_domain")
+
     def __init__(self, element, restriction_domain):
         if not isinstance(element, FiniteElementBase):
             error("Expecting a finite element instance.")
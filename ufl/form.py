@@ -11,7 +11,6 @@
 # Modified by Massimiliano Leoni, 2016.
 # Modified by Cecile Daversin-Catty, 2018.
 
-from itertools import chain
 from collections import defaultdict
 
 from ufl.log import error, warning
@@ -75,6 +74,7 @@ class Form(object):
         # --- List of Integral objects (a Form is a sum of these Integrals, everything else is derived)
         "_integrals",
         # --- Internal variables for caching various data
+        "_integrals_by_type",
         "_integration_domains",
         "_domain_numbering",
         "_subdomain_data",
@@ -88,6 +88,8 @@ class Form(object):
         #     data in to be carried with the form
         #     Never use this internally in ufl!
         "_cache",
+        # --- Allow algorithms to cache data per form in weak mappings
+        "__weakref__",
     )
 
     def __init__(self, integrals):
@@ -99,6 +101,7 @@ class Form(object):
         # Store integrals sorted canonically to increase signature
         # stability
         self._integrals = _sorted_integrals(integrals)
+        self._integrals_by_type = None
 
         # Internal variables for caching domain data
         self._integration_domains = None
@@ -111,9 +114,7 @@ class Form(object):
         self._arguments = None
         self._coefficients = None
         self._coefficient_numbering = None
-
-        from ufl.algorithms.analysis import extract_constants
-        self._constants = extract_constants(self)
+        self._constants = None
 
         # Internal variables for caching of hash and signature after
         # first request
@@ -131,8 +132,12 @@ class Form(object):
 
     def integrals_by_type(self, integral_type):
         "Return a sequence of all integrals with a particular domain type."
-        return tuple(integral for integral in self.integrals()
-                     if integral.integral_type() == integral_type)
+        if self._integrals_by_type is None:
+            integrals_by_type = {}
+            for integral in self.integrals():
+                integrals_by_type.setdefault(integral.integral_type(), []).append(integral)
+            self._integrals_by_type = dict((k, tuple(v)) for k, v in integrals_by_type.items())
+        return self._integrals_by_type.get(integral_type, ())
 
     def integrals_by_domain(self, domain):
         "Return a sequence of all integrals with a particular integration domain."
@@ -186,13 +191,18 @@ class Form(object):
 
     def geometric_dimension(self):
         "Return the geometric dimension shared by all domains and functions in this form."
-        gdims = tuple(
-            set(domain.geometric_dimension() for domain in self.ufl_domains()))
-        if len(gdims) != 1:
+        domains = self.ufl_domains()
+        gdim = domains[0].geometric_dimension() if domains else None
+        for domain in domains[1:]:
+            if domain.geometric_dimension() != gdim:
+                gdim = None
+                break
+        if gdim is None:
+            gdims = set(domain.geometric_dimension() for domain in domains)
             error("Expecting all domains and functions in a form "
                   "to share geometric dimension, got %s." % str(
                       tuple(sorted(gdims))))
-        return gdims[0]
+        return gdim
 
     def domain_numbering(self):
         """Return a contiguous numbering of domains in a mapping
@@ -235,6 +245,9 @@ class Form(object):
         return self._coefficient_numbering
 
     def constants(self):
+        if self._constants is None:
+            from ufl.algorithms.analysis import extract_constants
+            self._constants = extract_constants(self)
         return self._constants
 
     def signature(self):
@@ -281,7 +294,7 @@ class Form(object):
     def __add__(self, other):
         if isinstance(other, Form):
             # Add integrals from both forms
-            return Form(list(chain(self.integrals(), other.integrals())))
+            return Form(self.integrals() + other.integrals())
 
         elif isinstance(other, (int, float)) and other == 0:
             # Allow adding 0 or 0.0 as a no-op, needed for sum([a,b])
@@ -414,9 +414,6 @@ class CellVertices(GeometricCellQuantity):
     __slots__ = ()
     name = "CV"
 
-    def __init__(self, domain):
-        GeometricCellQuantity.__init__(self, domain)
-
     @property
     def ufl_shape(self):
         cell = self.ufl_domain().ufl_cell()
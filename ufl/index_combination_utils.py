@@ -101,7 +101,7 @@ def remove_indices(fi, fid, rfi):
         rk = rfip[k][0]
 
         # Keep
-        while fi[pos] < rk:
+        while pos < nfi and fi[pos] < rk:
             newfiid.append((fi[pos], fid[pos]))
             pos += 1
 
@@ -136,20 +136,29 @@ def create_slice_indices(component, shape, fi):
     all_indices = []
     slice_indices = []
     repeated_indices = []
-    free_indices = []
+    # Counts of free indices seen so far, including those of the
+    # indexed expression
+    seen_counts = set(fi)
+    found_ellipsis = False
 
     for ind in component:
         if isinstance(ind, Index):
             all_indices.append(ind)
-            if ind.count() in fi or ind in free_indices:
+            count = ind.count()
+            if count in seen_counts:
                 repeated_indices.append(ind)
-            free_indices.append(ind)
+            else:
+                seen_counts.add(count)
         elif isinstance(ind, FixedIndex):
+            if len(all_indices) >= len(shape):
+                error("Too many indices for shape {0}.".format(shape))
             if int(ind) >= shape[len(all_indices)]:
                 error("Index out of bounds.")
             all_indices.append(ind)
         elif isinstance(ind, int):
-            if int(ind) >= shape[len(all_indices)]:
+            if len(all_indices) >= len(shape):
+                error("Too many indices for shape {0}.".format(shape))
+            if ind >= shape[len(all_indices)]:
                 error("Index out of bounds.")
             all_indices.append(FixedIndex(ind))
         elif isinstance(ind, slice):
@@ -158,7 +167,10 @@ def create_slice_indices(component, shape, fi):
             i = Index()
             slice_indices.append(i)
             all_indices.append(i)
-        elif ind == Ellipsis:
+        elif ind is Ellipsis:
+            if found_ellipsis:
+                error("Found duplicate ellipsis.")
+            found_ellipsis = True
             er = len(shape) - len(component) + 1
             ii = indices(er)
             slice_indices.extend(ii)
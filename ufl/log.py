@@ -105,12 +105,29 @@ class Logger:
 
     def log(self, level, *message):
         "Write a log message on given log level."
+        # Skip formatting messages that no handler would emit
+        if not self._is_handled(level):
+            return
         text = self._format_raw(*message)
-        if len(text) >= 3 and text[-3:] == "...":
-            self._log.log(level, self._format(*message),
+        if text.endswith("..."):
+            self._log.log(level, self._indent(text),
                           extra={"continued": True})
         else:
-            self._log.log(level, self._format(*message))
+            self._log.log(level, self._indent(text))
+
+    def _is_handled(self, level):
+        "Return whether any handler reached by the logger accepts the given level."
+        if not self._log.isEnabledFor(level):
+            return False
+        log = self._log
+        while log is not None:
+            for h in log.handlers:
+                if level >= h.level:
+                    return True
+            if not log.propagate:
+                break
+            log = log.parent
+        return False
 
     def debug(self, *message):
         "Write debug message."
@@ -122,19 +139,23 @@ class Logger:
 
     def info_red(self, *message):
         "Write info message in red."
-        self.log(INFO, RED % self._format_raw(*message))
+        if self._is_handled(INFO):
+            self.log(INFO, RED % self._format_raw(*message))
 
     def info_green(self, *message):
         "Write info message in green."
-        self.log(INFO, GREEN % self._format_raw(*message))
+        if self._is_handled(INFO):
+            self.log(INFO, GREEN % self._format_raw(*message))
 
     def info_blue(self, *message):
         "Write info message in blue."
-        self.log(INFO, BLUE % self._format_raw(*message))
+        if self._is_handled(INFO):
+            self.log(INFO, BLUE % self._format_raw(*message))
 
     def deprecate(self, *message):
         "Write deprecation message."
-        self.log(DEPRECATE, RED % self._format_raw(*message))
+        if self._is_handled(DEPRECATE):
+            self.log(DEPRECATE, RED % self._format_raw(*message))
 
     def warning(self, *message):
         "Write warning message."
@@ -217,8 +238,12 @@ class Logger:
 
     def _format(self, *message):
         "Format message including indentation."
+        return self._indent(self._format_raw(*message))
+
+    def _indent(self, text):
+        "Indent already formatted message."
         indent = self._prefix + 2 * self._indent_level * " "
-        return "\n".join([indent + line for line in (message[0] % message[1:]).split("\n")])
+        return "\n".join([indent + line for line in text.split("\n")])
 
     def _format_raw(self, *message):
         "Format message without indentation."
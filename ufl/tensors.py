@@ -29,38 +29,42 @@ class ListTensor(Operator):
     def __new__(cls, *expressions):
         # All lists and tuples should already be unwrapped in
         # as_tensor
-        if any(not isinstance(e, Expr) for e in expressions):
+        e0 = expressions[0]
+        if not isinstance(e0, Expr):
             error("Expecting only UFL expressions in ListTensor constructor.")
 
         # Get properties of the first expression
-        e0 = expressions[0]
         sh = e0.ufl_shape
         fi = e0.ufl_free_indices
         fid = e0.ufl_index_dimensions
 
-        # Obviously, each subexpression must have the same shape
-        if any(sh != e.ufl_shape for e in expressions[1:]):
-            error("Cannot create a tensor by joining subexpressions with different shapes.")
-        if any(fi != e.ufl_free_indices for e in expressions[1:]):
-            error("Cannot create a tensor where the components have different free indices.")
-        if any(fid != e.ufl_index_dimensions for e in expressions[1:]):
-            error("Cannot create a tensor where the components have different free index dimensions.")
+        # Check the remaining expressions against the first in a
+        # single pass
+        all_zero = isinstance(e0, Zero)
+        for e in expressions[1:]:
+            if not isinstance(e, Expr):
+                error("Expecting only UFL expressions in ListTensor constructor.")
+            # Obviously, each subexpression must have the same shape
+            if sh != e.ufl_shape:
+                error("Cannot create a tensor by joining subexpressions with different shapes.")
+            if fi != e.ufl_free_indices:
+                error("Cannot create a tensor where the components have different free indices.")
+            if fid != e.ufl_index_dimensions:
+                error("Cannot create a tensor where the components have different free index dimensions.")
+            all_zero = all_zero and isinstance(e, Zero)
 
         # Simplify to Zero if possible
-        if all(isinstance(e, Zero) for e in expressions):
+        if all_zero:
             shape = (len(expressions),) + sh
             return Zero(shape, fi, fid)
 
         return Operator.__new__(cls)
 
     def __init__(self, *expressions):
+        # Free indices are stored as sorted tuples, so comparing them
+        # in __new__ already checks that all components share them
         Operator.__init__(self, expressions)
 
-        # Checks
-        indexset = set(self.ufl_operands[0].ufl_free_indices)
-        if not all(not (indexset ^ set(e.ufl_free_indices)) for e in self.ufl_operands):
-            error("Can't combine subtensor expressions with different sets of free indices.")
-
     @property
     def ufl_shape(self):
         return (len(self.ufl_operands),) + self.ufl_operands[0].ufl_shape
@@ -183,7 +187,8 @@ def numpy2nestedlists(arr):
     from numpy import ndarray
     if not isinstance(arr, ndarray):
         return arr
-    return [numpy2nestedlists(arr[k]) for k in range(arr.shape[0])]
+    # Converts all levels at once, keeping object entries as they are
+    return arr.tolist()
 
 
 def _as_list_tensor(expressions):
@@ -14,14 +14,14 @@ def counted_init(self, count=None, countedclass=None):
     if countedclass is None:
         countedclass = type(self)
 
+    globalcount = countedclass._globalcount
     if count is None:
-        count = countedclass._globalcount
+        count = globalcount
+    if count >= globalcount:
+        countedclass._globalcount = count + 1
 
     self._count = count
 
-    if self._count >= countedclass._globalcount:
-        countedclass._globalcount = self._count + 1
-
 
 class ExampleCounted(object):
     """An example class for classes of objects identified by a global counter.
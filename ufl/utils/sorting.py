@@ -7,6 +7,8 @@
 #
 # SPDX-License-Identifier:    LGPL-3.0-or-later
 
+from operator import methodcaller
+
 from ufl.log import warning
 
 
@@ -48,12 +50,12 @@ def topological_sorting(nodes, edges):
 
 def sorted_by_count(seq):
     "Sort a sequence by the item.count()."
-    return sorted(seq, key=lambda x: x.count())
+    return sorted(seq, key=methodcaller("count"))
 
 
 def sorted_by_ufl_id(seq):
     "Sort a sequence by the item.ufl_id()."
-    return sorted(seq, key=lambda x: x.ufl_id())
+    return sorted(seq, key=methodcaller("ufl_id"))
 
 
 def sorted_by_key(mapping):